@@ -8,15 +8,30 @@
 #       2) IIoT_Smart_Parking_Management.csv
 # - Uses SDSU Parking Structure latitude/longitude values for
 #   parking space (so we can visualize them on a map)
+#   (--mode simple puts every spot in one grid around BASE_LAT/BASE_LON)
 # - Builds an interactive folium map with:
 #       * LADOT layer (occupied vs vacant)
 #       * IoT layer (occupied vs vacant)
 # - Saves output as SmartParkingMap.html
 # ======================================================
 
+import argparse
+import numpy as np
 import pandas as pd
 import folium
 import math
+from functools import lru_cache
+from pathlib import Path
+
+# pyarrow is optional: when installed we use its multithreaded CSV parser
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# String dtype for building popup text; Arrow strings concatenate in C++
+TEXT_DTYPE = "string[pyarrow]" if HAS_PYARROW else str
 
 # -----------------------------
 # 1. Configuration
@@ -26,6 +41,9 @@ import math
 LADOT_CSV = "LADOT_Parking_Meter_Occupancy.csv"
 IOT_CSV   = "IIoT_Smart_Parking_Management.csv"
 
+# Title, legend and reserveSpot() script shared by every map
+OVERLAYS_HTML = Path(__file__).parent / "static" / "overlays.html"
+
 # Cluster centers for each SDSU parking structure
 PARKING_CLUSTERS = {
     "PS1":  (32.775596, -117.067279),
@@ -38,22 +56,56 @@ PARKING_CLUSTERS = {
     "PS6":  (32.772089, -117.074934),
 }
 
+# Single fake grid around the middle of campus (--mode simple)
+BASE_LAT = 32.7763
+BASE_LON = -117.0720
+PARKING_CLUSTERS_SIMPLE = {"ALL": (BASE_LAT, BASE_LON)}
+
+CLUSTER_MODES = {
+    "sdsu":   PARKING_CLUSTERS,
+    "simple": PARKING_CLUSTERS_SIMPLE,
+}
+
+# (Optional) down-sample so the map isn't crazy busy
+# Set to None if you want all rows
+MAX_ROWS = 150
+
+# Colors each GeoJSON marker and binds its prebuilt popup HTML.
+# Runs before the marker is added to the map, so the icon is drawn
+# with the right markerColor (no Python-side style_function needed).
+SPOT_FEATURE_JS = folium.JsCode("""
+function(feature, layer) {
+    layer.options.icon.options.markerColor = feature.properties.color;
+    layer.bindPopup(feature.properties.popup, {maxWidth: 250});
+}
+""")
+
 PER_ROW = 8         # a narrow grid for the parking spots
 SPACING = 0.00015   # tight cluster around each structure
 
 # -----------------------------
-# 2. Helper: generate parking cluster coordinates
+# 2. Helpers: CSV loading, parking cluster coordinates, map output
 # -----------------------------
 
-def generate_fake_coordinates(ids, base_lat, base_lon, spacing=0.0002, per_row=10):
+def read_csv(path, nrows=None, **kwargs):
+    """
+    pd.read_csv that uses the pyarrow engine when pyarrow is available
+    and falls back to the default pandas parser otherwise.
+    pyarrow can't stop after nrows, so a row limit uses the default
+    parser, which only reads as much of the file as it needs.
+    """
+    if HAS_PYARROW and nrows is None:
+        return pd.read_csv(path, engine="pyarrow", **kwargs)
+    return pd.read_csv(path, nrows=nrows, **kwargs)
+
+def generate_fake_coordinates(n, base_lat, base_lon, spacing=0.0002, per_row=10):
     """
     Center the fake grid around (base_lat, base_lon) so the cluster
     stays roughly on top of the parking structure.
+    Returns two arrays (lats, lons), one entry per spot.
     """
-    ids = list(ids)
-    n = len(ids)
     if n == 0:
-        return {}
+        return np.empty(0), np.empty(0)
 
     # How many rows we need for this many IDs?
     num_rows = math.ceil(n / per_row)
@@ -62,68 +114,162 @@ def generate_fake_coordinates(ids, base_lat, base_lon, spacing=0.0002, per_row=1
     row_center = (num_rows - 1) / 2.0
     col_center = (per_row - 1) / 2.0
 
-    coords = {}
-    for i, pid in enumerate(ids):
-        row = i // per_row
-        col = i % per_row
+    i = np.arange(n)
+    row = i // per_row
+    col = i % per_row
 
-        lat = base_lat + (row - row_center) * spacing
-        lon = base_lon + (col - col_center) * spacing
+    lats = base_lat + (row - row_center) * spacing
+    lons = base_lon + (col - col_center) * spacing
 
-        coords[pid] = (lat, lon)
-
-    return coords
+    return lats, lons
 
 def assign_coords_to_clusters(ids, cluster_centers, spacing=0.0002, per_row=10):
-    ids = list(ids)
-    coords = {}
-    cluster_map = {}
+    """
+    Spread the IDs across the parking structures and return a DataFrame
+    indexed by ID with Latitude, Longitude and Structure columns.
+    """
+    ids = np.asarray(ids)
     n = len(ids)
     k = len(cluster_centers)
 
-    if k == 0 or n == 0:
-        return coords, cluster_map
+    lat_out = np.full(n, np.nan)
+    lon_out = np.full(n, np.nan)
+    # Structure is stored as categorical codes into the cluster names
+    # (-1 = no structure), which keeps the later groupby cheap
+    cluster_codes = np.full(n, -1, dtype=np.int16)
+
+    if k > 0 and n > 0:
+        # Even split of spots among structures (sizes differ by at most 1)
+        groups = np.array_split(ids, k)
+        chunk_sizes = np.array([len(g) for g in groups], dtype=np.int64)
+        centers = np.array(list(cluster_centers.values()), dtype=np.float64)
+
+        idx = 0
+        for size, (base_lat, base_lon) in zip(chunk_sizes, centers):
+            end = idx + size
+            lat_out[idx:end], lon_out[idx:end] = generate_fake_coordinates(
+                size,
+                base_lat,
+                base_lon,
+                spacing=spacing,
+                per_row=per_row
+            )
+            idx = end
+
+        cluster_codes[:] = np.repeat(np.arange(k, dtype=np.int16), chunk_sizes)
+
+    structure = pd.Categorical.from_codes(
+        cluster_codes, categories=list(cluster_centers)
+    )
 
-    # Roughly even split of spots among structures
-    chunk_size = math.ceil(n / k)
-    idx = 0
+    return pd.DataFrame(
+        {"Latitude": lat_out, "Longitude": lon_out, "Structure": structure},
+        index=ids,
+    )
 
-    for name, (base_lat, base_lon) in cluster_centers.items():
-        chunk = ids[idx:idx + chunk_size]
-        if not chunk:
-            break
+def build_popup_ids(prefix, spot):
+    """
+    Unique HTML id per row: prefix + spot ID + "_" + row index,
+    concatenated as whole columns.
+    """
+    return (
+        prefix
+        + spot.astype(TEXT_DTYPE)
+        + "_"
+        + pd.Series(spot.index, index=spot.index).astype(TEXT_DTYPE)
+    )
 
-        local_coords = generate_fake_coordinates(
-            chunk,
-            base_lat,
-            base_lon,
-            spacing=spacing,
-            per_row=per_row
-        )
+def build_popup_html(label, spot, status, time_label, times, popup_id):
+    """
+    Build the popup HTML for a whole column of spots at once.
+    VACANT spots get a Reserve button; everything else is read-only.
+    Inputs are Series aligned on the same index; returns an array of str.
+    """
+    spot = spot.astype(TEXT_DTYPE)
+    times = times.fillna("N/A").astype(TEXT_DTYPE)
+
+    vacant_html = (
+        "<div id=\"" + popup_id + "\">"
+        "<b>" + label + " Spot:</b> " + spot + "<br>"
+        "<b>Status:</b> <span class=\"spot-status\">VACANT</span><br>"
+        "<b>" + time_label + ":</b> " + times + "<br><br>"
+        "<button onclick=\"reserveSpot('" + popup_id + "')\">"
+        "Reserve this spot"
+        "</button>"
+        "</div>"
+    )
+    occupied_html = (
+        "<div>"
+        "<b>" + label + " Spot:</b> " + spot + "<br>"
+        "<b>Status:</b> " + status + "<br>"
+        "<b>" + time_label + ":</b> " + times +
+        "</div>"
+    )
+
+    return np.where(status.eq("VACANT"), vacant_html, occupied_html)
+
+def spots_to_geojson(lats, lons, popup_html, colors):
+    """
+    Pack the spots into a single GeoJSON FeatureCollection so each layer
+    is one folium object and Leaflet builds the markers client-side.
+    """
+    # All [lon, lat] pairs in one vectorized call (GeoJSON is lon-first)
+    coords = np.column_stack((lons.to_numpy(), lats.to_numpy())).tolist()
+
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": xy},
+            "properties": {"popup": html, "color": color},
+        }
+        for xy, html, color in zip(coords, popup_html.tolist(), colors.tolist())
+    ]
+    return {"type": "FeatureCollection", "features": features}
 
-        coords.update(local_coords)
-        for pid in chunk:
-            cluster_map[pid] = name
-        idx += chunk_size
+@lru_cache(maxsize=None)
+def load_overlays_html():
+    """
+    Read the static title/legend/reserveSpot HTML once and reuse it for
+    every map built in this process.
+    """
+    return OVERLAYS_HTML.read_text(encoding="utf-8")
 
-    return coords, cluster_map
+def save_map(m, output_file):
+    """
+    Write the map HTML to disk as the page template renders, instead of
+    building the whole page string (plus its UTF-8 copy) in memory the
+    way m.save() does.
+    """
+    root = m.get_root()
+    # Same steps as Figure.render(), but streaming the final template
+    for child in root._children.values():
+        child.render()
+    with open(output_file, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+        root._template.stream(this=root, kwargs={}).dump(f)
 
 # -----------------------------
 # 3. Main script
 # -----------------------------
 
-def main():
+def main(mode="sdsu"):
+    cluster_centers = CLUSTER_MODES[mode]
+
     # -------------------------
     # Load CSV data
     # -------------------------
     print("Loading CSV files...")
-    ladot = pd.read_csv(LADOT_CSV)
-    iot   = pd.read_csv(IOT_CSV)
-
-    # (Optional) down-sample so the map isn't crazy busy
-    # Comment these two lines out if you want all rows
-    ladot = ladot.head(150)
-    iot   = iot.head(150)
+    ladot = read_csv(
+        LADOT_CSV,
+        nrows=MAX_ROWS,
+        usecols=["SpaceID", "OccupancyState", "EventTime_UTC"]
+    )
+    # keep Timestamp as the original text (pyarrow would parse it to datetime)
+    iot   = read_csv(
+        IOT_CSV,
+        nrows=MAX_ROWS,
+        usecols=["Parking_Spot_ID", "Sensor_Reading_Proximity", "Timestamp"],
+        dtype={"Timestamp": str}
+    )
 
     print("LADOT columns:", ladot.columns.tolist())
     print("IoT columns:", iot.columns.tolist())
@@ -134,70 +280,74 @@ def main():
 
     # LADOT uses SpaceID as the parking spot identifier
     ladot_ids = ladot["SpaceID"].unique()
-    ladot_coords, ladot_cluster_map = assign_coords_to_clusters(
+    ladot_coords = assign_coords_to_clusters(
         ladot_ids,
-        PARKING_CLUSTERS,
+        cluster_centers,
         spacing=SPACING,
         per_row=PER_ROW
     )
 
-    ladot["Latitude"] = ladot["SpaceID"].apply(lambda x: ladot_coords[x][0])
-    ladot["Longitude"] = ladot["SpaceID"].apply(lambda x: ladot_coords[x][1])
-    ladot["Structure"] = ladot["SpaceID"].apply(lambda x: ladot_cluster_map.get(x, "Unknown"))
+    # One vectorized join instead of a per-row lookup
+    ladot = ladot.join(ladot_coords, on="SpaceID")
 
     # ----- IoT coordinates -----
     iot_ids = iot["Parking_Spot_ID"].unique()
-    iot_coords, iot_cluster_map = assign_coords_to_clusters(
+    iot_coords = assign_coords_to_clusters(
         iot_ids,
-        PARKING_CLUSTERS,
+        cluster_centers,
         spacing=SPACING,
         per_row=PER_ROW
     )   
 
-    iot["Latitude"] = iot["Parking_Spot_ID"].apply(lambda x: iot_coords[x][0])
-    iot["Longitude"] = iot["Parking_Spot_ID"].apply(lambda x: iot_coords[x][1])
-    iot["Structure"] = iot["Parking_Spot_ID"].apply(lambda x: iot_cluster_map.get(x, "Unknown"))
+    iot = iot.join(iot_coords, on="Parking_Spot_ID")
 
     # Normalize LADOT occupancy status:
-    ladot["OccNormalized"] = (
-        ladot["OccupancyState"]
-        .fillna("UNKNOWN")
-        .astype(str)
-        .str.upper()
-        .str.strip()
-        .apply(lambda v: "VACANT" if v == "VACANT" else "OCCUPIED")
-    )
+    # OccupancyState only has a handful of distinct values, so clean up
+    # those once and broadcast the result back through the factorize codes
+    state_codes, states = pd.factorize(ladot["OccupancyState"], use_na_sentinel=False)
+    states = pd.Series(states).fillna("UNKNOWN").astype(str).str.upper()
+    is_vacant = states.str.strip().eq("VACANT").to_numpy()
+
+    # OccupancyState is typically "OCCUPIED" or "VACANT"
+    ladot["status"] = states.to_numpy()[state_codes]
+    ladot["OccNormalized"] = np.where(is_vacant[state_codes], "VACANT", "OCCUPIED")
+
+    ladot["is_occupied"] = ladot["OccNormalized"].eq("OCCUPIED").astype(np.int32)
 
     # Each LADOT row = one marker on the map, so use size (row count)
     capacity = (
-        ladot.groupby("Structure")
+        ladot.groupby("Structure", observed=True)
              .agg(
                  total_spots=("SpaceID", "size"),  # how many LADOT markers in that structure
-                 occupied=("OccNormalized", lambda s: (s == "OCCUPIED").sum())
+                 occupied=("is_occupied", "sum")
              )
              .reset_index()
     )
 
-    capacity["vacant"] = capacity["total_spots"] - capacity["occupied"]
-    capacity["pct_full"] = (capacity["occupied"] / capacity["total_spots"] * 100).round(1)
+    # Do the column math on plain 1-D arrays so it never depends on the
+    # memory layout of the block groupby/agg happened to return
+    total_spots = np.ascontiguousarray(capacity["total_spots"].to_numpy())
+    occupied = np.ascontiguousarray(capacity["occupied"].to_numpy())
+    capacity["vacant"] = total_spots - occupied
+    capacity["pct_full"] = np.round(occupied / total_spots * 100, 1)
 
     # Build small HTML table for overlay
-    rows_html = ""
-    for _, r in capacity.iterrows():
-        struct = r["Structure"]
-        total = int(r["total_spots"])
-        occ   = int(r["occupied"])
-        vac   = int(r["vacant"])
-        pct   = r["pct_full"]
-        rows_html += (
-            f"<tr>"
-            f"<td style='padding:2px 4px;'>{struct}</td>"
-            f"<td style='padding:2px 4px;'>{total}</td>"
-            f"<td style='padding:2px 4px;'>{occ}</td>"
-            f"<td style='padding:2px 4px;'>{vac}</td>"
-            f"<td style='padding:2px 4px;'>{pct}%</td>"
-            f"</tr>"
+    rows_html = "".join(
+        f"<tr>"
+        f"<td style='padding:2px 4px;'>{struct}</td>"
+        f"<td style='padding:2px 4px;'>{total}</td>"
+        f"<td style='padding:2px 4px;'>{occ}</td>"
+        f"<td style='padding:2px 4px;'>{vac}</td>"
+        f"<td style='padding:2px 4px;'>{pct}%</td>"
+        f"</tr>"
+        for struct, total, occ, vac, pct in zip(
+            capacity["Structure"].tolist(),
+            capacity["total_spots"].astype(int).tolist(),
+            capacity["occupied"].astype(int).tolist(),
+            capacity["vacant"].astype(int).tolist(),
+            capacity["pct_full"].tolist(),
         )
+    )
 
     capacity_html = (
         "<div style=\""
@@ -223,120 +373,44 @@ def main():
     # Build the folium map
     # -------------------------
     print("Building folium map...")
-    m = folium.Map(location=[32.7763, -117.0720], zoom_start=16)
-
-    ladot_layer = folium.FeatureGroup(name="LADOT Occupancy")
-    iot_layer   = folium.FeatureGroup(name="IoT Occupancy")
-
-    # ---------- STYLING: TITLE OVERLAY ----------
-    title_html = """
-         <div style="
-            position: fixed;
-            top: 10px;
-            left: 50%;
-            transform: translateX(-50%);
-            z-index: 9999;
-            background: rgba(0,0,0,0.75);
-            color: white;
-            padding: 8px 16px;
-            border-radius: 8px;
-            font-family: system-ui, sans-serif;
-            font-size: 16px;">
-            <b>SDSU Smart Parking Map</b><br>
-            <span style="font-size: 12px;">
-                Green = Available | Red = Occupied
-            </span>
-         </div>
-    """
-    m.get_root().html.add_child(folium.Element(title_html))
-
-    # ---------- STYLING: LEGEND OVERLAY ----------
-    legend_html = """
-    <div style="
-         position: fixed;
-         bottom: 20px;
-         left: 20px;
-         z-index:9999;
-         background: white;
-         padding: 10px 12px;
-         border: 1px solid #ccc;
-         border-radius: 6px;
-         font-size: 12px;
-         font-family: system-ui, sans-serif;">
-      <b>Legend</b><br>
-      <i style="background: green; width:10px; height:10px; display:inline-block;"></i>
-      Available<br>
-      <i style="background: red; width:10px; height:10px; display:inline-block;"></i>
-      Occupied
-    </div>
-    """
-    m.get_root().html.add_child(folium.Element(legend_html))
+    m = folium.Map(location=[BASE_LAT, BASE_LON], zoom_start=16)
+
+    # ---------- STYLING: TITLE + LEGEND, JS: Reserve function ----------
+    m.get_root().html.add_child(folium.Element(load_overlays_html()))
 
     # ---------- STYLING: CAPACITY OVERLAY (LADOT ONLY) ----------
     m.get_root().html.add_child(folium.Element(capacity_html))
 
-    # ---------- JS: Reserve function ----------
-    reserve_js = """
-    <script>
-    function reserveSpot(elId) {
-        var container = document.getElementById(elId);
-        if (!container) return;
-
-        // Change the status text
-        var statusSpan = container.querySelector('.spot-status');
-        if (statusSpan) {
-            statusSpan.textContent = 'RESERVED (demo)';
-            statusSpan.style.color = 'red';
-        }
-
-        // Disable the button after reserving
-        var btn = container.querySelector('button');
-        if (btn) {
-            btn.disabled = true;
-            btn.textContent = 'Spot Reserved';
-        }
-    }
-    </script>
-    """
-    m.get_root().html.add_child(folium.Element(reserve_js))
-
     # -------------------------
     # LADOT markers
     # -------------------------
 
-    # OccupancyState is typically "OCCUPIED" or "VACANT"
-    for idx, row in ladot.iterrows():
-        status = str(row.get("OccupancyState", "UNKNOWN")).upper()
-        color = "green" if status == "VACANT" else "red"
-
-        # give each popup a unique HTML id
-        popup_id = f"ladot_spot_{row['SpaceID']}_{idx}"
-
-        if status == "VACANT":
-            popup_html = f"""
-            <div id="{popup_id}">
-                <b>LADOT Spot:</b> {row['SpaceID']}<br>
-                <b>Status:</b> <span class="spot-status">VACANT</span><br>
-                <b>Event Time (UTC):</b> {row.get('EventTime_UTC', 'N/A')}<br><br>
-                <button onclick="reserveSpot('{popup_id}')">
-                    Reserve this spot
-                </button>
-            </div>
-            """
-        else:
-            popup_html = f"""
-            <div>
-                <b>LADOT Spot:</b> {row['SpaceID']}<br>
-                <b>Status:</b> {status}<br>
-                <b>Event Time (UTC):</b> {row.get('EventTime_UTC', 'N/A')}
-            </div>
-            """
-
-        folium.Marker(
-            [row["Latitude"], row["Longitude"]],
-            popup=folium.Popup(popup_html, max_width=250),
-            icon=folium.Icon(color=color, icon="car", prefix="fa")
-        ).add_to(ladot_layer)
+    ladot["color"] = np.where(ladot["status"].eq("VACANT"), "green", "red")
+
+    # give each popup a unique HTML id
+    ladot["popup_id"] = build_popup_ids("ladot_spot_", ladot["SpaceID"])
+
+    ladot["popup_html"] = build_popup_html(
+        "LADOT",
+        ladot["SpaceID"],
+        ladot["status"],
+        "Event Time (UTC)",
+        ladot["EventTime_UTC"],
+        ladot["popup_id"]
+    )
+
+    # The whole layer is one GeoJson object; Leaflet builds the markers
+    folium.GeoJson(
+        spots_to_geojson(
+            ladot["Latitude"],
+            ladot["Longitude"],
+            ladot["popup_html"],
+            ladot["color"]
+        ),
+        name="LADOT Occupancy",
+        marker=folium.Marker(icon=folium.Icon(icon="car", prefix="fa")),
+        on_each_feature=SPOT_FEATURE_JS
+    ).add_to(m)
 
     # -------------------------
     # IoT markers
@@ -344,49 +418,51 @@ def main():
 
     # Sensor_Reading_Proximity:
     #   we will assume 0 = VACANT, anything else = OCCUPIED
-    for idx, row in iot.iterrows():
-        prox = row.get("Sensor_Reading_Proximity", 1)
-        status = "VACANT" if prox == 0 else "OCCUPIED"
-        color = "green" if status == "VACANT" else "red"
-        popup_id = f"iot_spot_{row['Parking_Spot_ID']}_{idx}"
-
-        if status == "VACANT":
-            popup_html = f"""
-            <div id="{popup_id}">
-                <b>IoT Spot:</b> {row['Parking_Spot_ID']}<br>
-                <b>Status:</b> <span class="spot-status">VACANT</span><br>
-                <b>Timestamp:</b> {row.get('Timestamp', 'N/A')}<br><br>
-                <button onclick="reserveSpot('{popup_id}')">
-                    Reserve this spot
-                </button>
-            </div>
-            """
-        else:
-            popup_html = f"""
-            <div>
-                <b>IoT Spot:</b> {row['Parking_Spot_ID']}<br>
-                <b>Status:</b> {status}<br>
-                <b>Timestamp:</b> {row.get('Timestamp', 'N/A')}
-            </div>
-            """
-        folium.Marker(
-            [row["Latitude"], row["Longitude"]],
-            popup=folium.Popup(popup_html, max_width=250),
-            icon=folium.Icon(color=color, icon="info-sign")
-        ).add_to(iot_layer)
-
-    # Add layers & controls
-    ladot_layer.add_to(m)
-    iot_layer.add_to(m)
+    iot["status"] = np.where(
+        iot["Sensor_Reading_Proximity"].fillna(1).eq(0), "VACANT", "OCCUPIED"
+    )
+    iot["color"] = np.where(iot["status"].eq("VACANT"), "green", "red")
+    iot["popup_id"] = build_popup_ids("iot_spot_", iot["Parking_Spot_ID"])
+
+    iot["popup_html"] = build_popup_html(
+        "IoT",
+        iot["Parking_Spot_ID"],
+        iot["status"],
+        "Timestamp",
+        iot["Timestamp"],
+        iot["popup_id"]
+    )
+
+    folium.GeoJson(
+        spots_to_geojson(
+            iot["Latitude"],
+            iot["Longitude"],
+            iot["popup_html"],
+            iot["color"]
+        ),
+        name="IoT Occupancy",
+        marker=folium.Marker(icon=folium.Icon(icon="info-sign")),
+        on_each_feature=SPOT_FEATURE_JS
+    ).add_to(m)
+
+    # Layer controls
     folium.LayerControl().add_to(m)
     
     # -------------------------
     # Save map
     # -------------------------
     output_file = "SmartParkingMap.html"
-    m.save(output_file)
+    save_map(m, output_file)
     print(f"Map saved as {output_file}")
     print("Open it in your browser to view the interactive map.")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Build the Smart Parking folium map.")
+    parser.add_argument(
+        "--mode",
+        choices=sorted(CLUSTER_MODES),
+        default="sdsu",
+        help="sdsu = spots split across the parking structures, "
+             "simple = one grid around BASE_LAT/BASE_LON"
+    )
+    main(parser.parse_args().mode)